@@ -166,6 +166,11 @@ def main():
 @click.option(
     "--use-celery", is_flag=True, help="Include Celery for async tasks (Django)"
 )
+@click.option(
+    "--cache-profile",
+    type=click.Choice(["compact", "pickle"]),
+    help="Redis cache encoding (for Django: compact = msgpack + zstd, pickle = django-redis defaults)",
+)
 @click.option(
     "--output-dir", "-o", default=".", help="Output directory (default: current)"
 )
@@ -182,6 +187,7 @@ def init(
     python_version,
     use_graphql,
     use_celery,
+    cache_profile,
     output_dir,
     force,
     dry_run,
@@ -194,7 +200,7 @@ def init(
     Examples:
         cfs init springboot -p my-api -l java -a rest
         cfs init flutter -p my_app
-        cfs init django -p my_backend --package-name myapp -d postgresql --use-graphql --use-celery
+        cfs init django -p my_backend --package-name myapp -d postgresql --use-graphql --use-celery --cache-profile compact
         cfs init react -p my-web-app
     """
 
@@ -275,6 +281,8 @@ def init(
             cli_value = use_graphql if use_graphql else None
         elif var_name == "use_celery":
             cli_value = use_celery if use_celery else None
+        elif var_name == "cache_profile":
+            cli_value = cache_profile
 
         if cli_value is not None:
             variables[var_name] = cli_value
@@ -142,6 +142,8 @@ UTIL_PACKAGES=(
     "gunicorn"
     "whitenoise"
     "django-redis"
+    "msgpack"        # Compact cache profile serializer
+    "pyzstd"         # Compact cache profile compressor
 )
 
 for package in "${UTIL_PACKAGES[@]}"; do
@@ -8,7 +8,9 @@ import shutil
 import subprocess
 from pathlib import Path
 from typing import Dict, Any, List
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, TemplateNotFound
+
+from cfs_cli.precompile import create_template_loader
 
 from .exceptions.flutter_exceptions import FlutterGeneratorError
 
@@ -67,7 +69,7 @@ class FlutterGenerator:
             template_files_path.mkdir(parents=True, exist_ok=True)
 
         self.jinja_env = Environment(
-            loader=FileSystemLoader(str(template_files_path)),
+            loader=create_template_loader(template_files_path, self.template_path),
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True
@@ -7,7 +7,9 @@ import os
 import subprocess
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, TemplateNotFound
+
+from cfs_cli.precompile import create_template_loader
 
 from .exceptions.spring_generator_error import SpringGeneratorError
 
@@ -48,7 +50,7 @@ class SpringGenerator:
             )
 
         self.jinja_env = Environment(
-            loader=FileSystemLoader(str(template_files_path)),
+            loader=create_template_loader(template_files_path, self.template_path),
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True
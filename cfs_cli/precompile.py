@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Precompiled template support for CFS generators.
+
+The bundled ``.j2`` sources are compiled into importable Python modules at
+build time so installed generators can skip Jinja2 lexing and compilation.
+Generators load them through ``jinja2.ModuleLoader`` and fall back to the
+``FileSystemLoader`` whenever a source no longer matches what was compiled
+(or when no compiled directory exists, e.g. a user template directory).
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from jinja2 import BaseLoader, Environment, FileSystemLoader, ModuleLoader, TemplateNotFound
+from jinja2.utils import internalcode
+
+COMPILED_DIR_NAME = "compiled_templates"
+CHECKSUMS_FILE_NAME = "checksums.json"
+
+
+def _source_checksum(source: str) -> str:
+    """Return the checksum used to match a source against its compiled module."""
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+class PrecompiledLoader(BaseLoader):
+    """
+    Load templates from precompiled modules, falling back to the sources.
+
+    A compiled module is only used when its recorded source checksum still
+    matches the template on disk, so edited or newer sources are always
+    rendered from the file system.
+    """
+
+    def __init__(self, searchpath: Path, compiled_path: Path):
+        """
+        Initialize the loader.
+
+        Args:
+            searchpath: Directory containing the ``.j2`` template sources
+            compiled_path: Directory containing the precompiled modules
+        """
+        self.fs_loader = FileSystemLoader(str(searchpath))
+        self.module_loader = None
+        self.checksums: Dict[str, str] = {}
+
+        checksums_file = Path(compiled_path) / CHECKSUMS_FILE_NAME
+        if checksums_file.exists():
+            try:
+                with open(checksums_file, "r", encoding="utf-8") as f:
+                    self.checksums = json.load(f)
+                self.module_loader = ModuleLoader(str(compiled_path))
+            except (OSError, ValueError):
+                self.checksums = {}
+
+    def get_source(self, environment: Environment, template: str) -> Tuple[str, Optional[str], Optional[Callable[[], bool]]]:
+        return self.fs_loader.get_source(environment, template)
+
+    def list_templates(self) -> List[str]:
+        return self.fs_loader.list_templates()
+
+    @internalcode
+    def load(self, environment: Environment, name: str, globals: Optional[Dict[str, Any]] = None):
+        expected = self.checksums.get(name)
+        if self.module_loader is not None and expected is not None:
+            source, _, _ = self.fs_loader.get_source(environment, name)
+            if _source_checksum(source) == expected:
+                try:
+                    return self.module_loader.load(environment, name, globals)
+                except TemplateNotFound:
+                    pass
+        return self.fs_loader.load(environment, name, globals)
+
+
+def create_template_loader(template_files_path: Path, template_path: Path) -> BaseLoader:
+    """
+    Build the Jinja2 loader for a framework template directory.
+
+    Args:
+        template_files_path: Directory containing the ``.j2`` template sources
+        template_path: Framework template directory holding the compiled modules
+
+    Returns:
+        PrecompiledLoader when compiled modules are shipped, FileSystemLoader otherwise
+    """
+    compiled_path = Path(template_path) / COMPILED_DIR_NAME
+    if (compiled_path / CHECKSUMS_FILE_NAME).exists():
+        return PrecompiledLoader(template_files_path, compiled_path)
+    return FileSystemLoader(str(template_files_path))
+
+
+def compile_environment(environment: Environment, compiled_path: Path) -> int:
+    """
+    Compile every ``.j2`` template reachable from an environment.
+
+    Args:
+        environment: Generator environment (its filters and lexer options are baked in)
+        compiled_path: Directory to write the compiled modules to
+
+    Returns:
+        Number of compiled templates
+    """
+    compiled_path = Path(compiled_path)
+    compiled_path.mkdir(parents=True, exist_ok=True)
+
+    names = [name for name in environment.list_templates() if name.endswith(".j2")]
+    checksums = {}
+    for name in names:
+        source, _, _ = environment.loader.get_source(environment, name)
+        checksums[name] = _source_checksum(source)
+
+    environment.compile_templates(
+        str(compiled_path),
+        filter_func=lambda name: name in checksums,
+        zip=None,
+        ignore_errors=False,
+    )
+
+    with open(compiled_path / CHECKSUMS_FILE_NAME, "w", encoding="utf-8") as f:
+        json.dump(checksums, f, indent=2, sort_keys=True)
+
+    return len(checksums)
+
+
+def precompile_templates(templates_dir: Path) -> Dict[str, int]:
+    """
+    Precompile the templates of every framework found in a templates directory.
+
+    Args:
+        templates_dir: The ``modules/templates`` directory to process
+
+    Returns:
+        Mapping of framework name to number of compiled templates
+    """
+    from cfs_cli.cli import get_framework_modules
+
+    compiled = {}
+    for tpl in sorted(Path(templates_dir).iterdir()):
+        if not (tpl.is_dir() and (tpl / "manifest.yml").exists()):
+            continue
+
+        try:
+            GeneratorClass, _ = get_framework_modules(tpl.name)
+        except ImportError:
+            continue
+
+        generator = GeneratorClass(tpl)
+        generator.load_manifest()
+        compiled[tpl.name] = compile_environment(
+            generator.jinja_env, tpl / COMPILED_DIR_NAME
+        )
+
+    return compiled
+
+
+if __name__ == "__main__":
+    from cfs_cli.cli import get_templates_directory
+
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else get_templates_directory()
+    for framework, count in precompile_templates(target).items():
+        print(f"Precompiled {count} {framework} templates")
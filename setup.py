@@ -8,7 +8,32 @@
 # environments.
 # when the command `pip install -e.` is run, pip reads this file to determine how to build and install the package.
 
+import sys
+from pathlib import Path
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithPrecompiledTemplates(build_py):
+    """Build the package and precompile the bundled Jinja2 templates into it."""
+
+    def run(self):
+        super().run()
+
+        # Compile into the build directory so the wheel ships the modules
+        # while the source tree stays clean.
+        sys.path.insert(0, str(Path(__file__).resolve().parent))
+        try:
+            from cfs_cli.precompile import precompile_templates
+        except ImportError as e:
+            print(f"warning: skipping template precompilation ({e})")
+            return
+
+        templates_dir = Path(self.build_lib) / "cfs_cli" / "modules" / "templates"
+        for framework, count in precompile_templates(templates_dir).items():
+            print(f"precompiled {count} {framework} templates")
+
 
 setup(
     name="cfs-cli",                 
@@ -23,6 +48,9 @@ setup(
         "jinja2",
         "pyyaml",
     ],
+    cmdclass={
+        "build_py": BuildPyWithPrecompiledTemplates,
+    },
     entry_points={
         "console_scripts": [
             "cfs=cfs_cli.cli:main",  